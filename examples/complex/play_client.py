@@ -29,10 +29,14 @@ def _step(title: str) -> None:
     print("\n--- " + title)
 
 
+# json.dumps with non-default options builds a new encoder per call; reuse one.
+_PP_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, sort_keys=False)
+
+
 def _pp(obj: Any) -> str:
     """Pretty-print JSON-able objects."""
     try:
-        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=False)
+        return _PP_ENCODER.encode(obj)
     except Exception:
         return str(obj)
 
@@ -59,12 +63,11 @@ def extract_payload(result: Any) -> Any:
     if text is None:
         return str(content[0])
 
-    # Attempt JSON parsing
-    t = text.strip()
-    if (t.startswith("{") and t.endswith("}")) or (t.startswith("[") and t.endswith("]")):
+    # Attempt JSON parsing (json.loads tolerates surrounding whitespace itself)
+    if text.lstrip()[:1] in ("{", "["):
         try:
-            return json.loads(t)
-        except Exception:
+            return json.loads(text)
+        except ValueError:
             return text
     return text
 
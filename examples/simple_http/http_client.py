@@ -8,16 +8,27 @@ from mcp.types import ListToolsResult
 TOKEN = os.environ["TOKEN"]
 URL = "http://127.0.0.1:8080/mcp"
 
+# Built once and shared by every session so keep-alive connections are reused.
+HTTP_CLIENT = httpx.AsyncClient(
+    timeout=10.0,
+    headers={"Authorization": f"Bearer {TOKEN}"},
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+)
+
+
+async def list_tools() -> ListToolsResult:
+    # streamable_http_client does not close a client it did not create
+    async with streamable_http_client(URL, http_client=HTTP_CLIENT) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            return await session.list_tools()
+
+
 async def main():
-    async with httpx.AsyncClient(
-        timeout=10.0,
-        headers={"Authorization": f"Bearer {TOKEN}"},
-    ) as http_client:
-        async with streamable_http_client(URL, http_client=http_client) as (read, write, _):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                tools: ListToolsResult = await session.list_tools()
-                print(tools.model_dump_json(indent=2))
+    try:
+        tools = await list_tools()
+        print(tools.model_dump_json(indent=2))
+    finally:
+        await HTTP_CLIENT.aclose()
 
 asyncio.run(main())
-
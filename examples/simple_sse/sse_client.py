@@ -10,6 +10,9 @@ URL = "http://127.0.0.1:8081/sse"
 async def main() -> None:
     headers = {"Authorization": f"Bearer {TOKEN}"}
 
+    # sse_client builds (and closes) its own httpx.AsyncClient via httpx_client_factory,
+    # so a shared client cannot be passed in. When adapting this to a loop or service,
+    # keep one ClientSession open and reuse it rather than reconnecting per call.
     async with sse_client(url=URL, headers=headers, timeout=10.0) as (read, write):
         async with ClientSession(read, write) as session:
             await session.initialize()
@@ -4,10 +4,9 @@ from pathlib import Path
 
 import typer
 
-from clinic_mcp_server.clinic_server import DEFAULT_DB_PATH, mcp as clinic_mcp
-from clinic_mcp_server.clinic.sqlite.repo import SQLiteClinicRepository
-from clinic_mcp_server.mcp.runtime.runner import McpRunner
-from clinic_mcp_server.mcp.runtime.settings import ServerSettings
+# Only light imports at module level: fastmcp/uvicorn are deferred to the command that
+# needs them, so --help and reset-db stay fast.
+from clinic_mcp_server.clinic.sqlite.repo import DEFAULT_DB_PATH, SQLiteClinicRepository
 
 app = typer.Typer(add_completion=False)
 
@@ -49,5 +48,13 @@ def run(
         raise typer.BadParameter("transport must be one of: stdio | sse | streamable-http")
 
 
+    from clinic_mcp_server.clinic_server import close_repo, mcp as clinic_mcp
+    from clinic_mcp_server.mcp.runtime.runner import McpRunner
+    from clinic_mcp_server.mcp.runtime.settings import ServerSettings
+
     settings = ServerSettings.load(transport=transport, host=host, port=port)
-    McpRunner(clinic_mcp).run(settings)
+    try:
+        McpRunner(clinic_mcp).run(settings)
+    finally:
+        # closing runs PRAGMA optimize on every pooled connection before the process exits
+        close_repo()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 from clinic_mcp_server.clinic.domain.data_types import MembershipType
@@ -13,10 +14,13 @@ from clinic_mcp_server.clinic.domain.data_types import (
 )
 
 
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+
 def _validate_date(d: str | None, name: str) -> str | None:
     if d is None:
         return None
-    if len(d) != 10 or d[4] != "-" or d[7] != "-":
+    if _DATE_RE.fullmatch(d) is None:
         raise ValidationError(f"{name} must be YYYY-MM-DD. Got: {d!r}")
     return d
 
@@ -24,7 +28,7 @@ def _validate_date(d: str | None, name: str) -> str | None:
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegisterUserResult:
     user_id: int
     pay_id: int
@@ -51,17 +55,19 @@ class ClinicService:
         amount: float,
         membership_type: MembershipType,
     ) -> RegisterUserResult:
-        user_id = self.repo.add_user(
-            social_security_number,
-            first_name,
-            last_name,
-            address,
-            email,
-            phone_number,
-            membership_type,
-        )
-        pay_id = self.repo.add_payment_method(user_id, card_last_4, card_brand, card_exp, card_id)
-        bill_id = self.repo.bill_user(pay_id, float(amount))
+        # one commit for the whole registration; a failure leaves no half-registered user
+        with self.repo.transaction():
+            user_id = self.repo.add_user(
+                social_security_number,
+                first_name,
+                last_name,
+                address,
+                email,
+                phone_number,
+                membership_type,
+            )
+            pay_id = self.repo.add_payment_method(user_id, card_last_4, card_brand, card_exp, card_id)
+            bill_id = self.repo.bill_user(pay_id, amount)
         return RegisterUserResult(user_id=user_id, pay_id=pay_id, bill_id=bill_id)
 
     def add_payment_method(self, user_id: int, card_last_4: int, card_brand: str, card_exp: str, card_id: str) -> int:
@@ -89,8 +95,9 @@ class ClinicService:
         return self.repo.get_appointment_slot(slot_id)
 
     def schedule_appointment(self, user_id: int, pay_id: int, slot_id: int, payment_amount: float) -> int:
-        booked = self.repo.add_appointment(user_id, slot_id)
-        self.repo.bill_user(pay_id, float(payment_amount), slot_id=booked)
+        with self.repo.transaction():
+            booked = self.repo.add_appointment(user_id, slot_id)
+            self.repo.bill_user(pay_id, payment_amount, slot_id=booked)
         return booked
 
     def cancel_appointment(self, slot_id: int) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
 from typing import Protocol
 
 from .data_types import (
@@ -12,6 +13,9 @@ from .data_types import (
 
 
 class ClinicRepository(Protocol):
+    # Units of work: writes issued inside commit together or not at all
+    def transaction(self) -> AbstractContextManager[None]: ...
+
     # Users
     def add_user(
         self,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import itertools
 import os
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
 
 from clinic_mcp_server.clinic.domain.data_types import (
@@ -12,6 +15,95 @@ from clinic_mcp_server.clinic.domain.data_types import (
     User,
 )
 
+_STATEMENT_CACHE_SIZE = 256
+
+# users.membership_type is CHECK-constrained to these values: a plain dict hit per row
+# instead of the Enum call machinery.
+_MEMBERSHIP_BY_VALUE: dict[str, MembershipType] = {m.value: m for m in MembershipType}
+
+# Column order shared by every query that returns AppointmentSlot rows (see _slot_from_row).
+_SLOT_COLUMNS = "s.slot_id, d.dr_name, d.specialty, s.date, s.start_time, s.end_time, d.visit_fee, d.rating"
+
+
+def _slot_from_row(r: tuple) -> AppointmentSlot:
+    """
+    Build an AppointmentSlot from a row selected with _SLOT_COLUMNS (positional access).
+    Column affinities already yield the model's types, so validation is skipped.
+    """
+    return AppointmentSlot.model_construct(
+        slot_id=r[0],
+        dr_name=r[1],
+        specialty=r[2],
+        date=r[3],
+        start_time=r[4],
+        end_time=r[5],
+        visit_fee=r[6],
+        rating=r[7],
+    )
+
+
+def _build_search_doctors_sql(specialty: bool, min_rank: bool, max_fee: bool) -> str:
+    query = """
+            SELECT
+                d.dr_id,
+                d.dr_name,
+                d.specialty,
+                d.rating,
+                d.visit_fee,
+                (
+                    -- first free future slot in idx_slots_free_dr_date order: a seek per
+                    -- (filtered) doctor that stops at one row instead of aggregating;
+                    -- comparing the date/time columns directly keeps the range sargable
+                    SELECT s.date || ' ' || s.start_time
+                    FROM slots s
+                    WHERE s.dr_id = d.dr_id
+                      AND s.user_id IS NULL
+                      AND s.date >= date('now')
+                      AND (s.date > date('now') OR s.start_time >= time('now'))
+                    ORDER BY s.date, s.start_time
+                    LIMIT 1
+                ) AS next_available_appointment
+            FROM doctors d
+            WHERE 1=1
+        """
+    if specialty:
+        query += " AND d.specialty = ?"
+    if min_rank:
+        query += " AND d.rating >= ?"
+    if max_fee:
+        query += " AND d.visit_fee <= ?"
+    return query + " ORDER BY d.rating DESC"
+
+
+def _build_search_slots_sql(doctor_name: bool, start_date: bool, end_date: bool) -> str:
+    query = f"""
+            SELECT {_SLOT_COLUMNS}
+            FROM slots s
+            JOIN doctors d ON s.dr_id = d.dr_id
+            WHERE d.specialty = ?
+              AND s.user_id IS NULL
+              AND s.date >= date('now')
+        """
+    # s.date is compared bare (ISO text orders like the date; callers validate the format)
+    # so the range stays sargable on idx_slots_free_dr_date
+    if doctor_name:
+        query += " AND d.dr_name LIKE ?"
+    if start_date:
+        query += " AND s.date >= ?"
+    if end_date:
+        query += " AND s.date <= ?"
+    return query + " ORDER BY s.date ASC, s.start_time ASC LIMIT 10"
+
+
+# SQL per filter shape (which optional filters are given?), built once at import: the
+# identical strings keep hitting the connection's statement cache instead of being re-prepared.
+_SEARCH_DOCTORS_SQL = {
+    shape: _build_search_doctors_sql(*shape) for shape in itertools.product((False, True), repeat=3)
+}
+_SEARCH_SLOTS_SQL = {
+    shape: _build_search_slots_sql(*shape) for shape in itertools.product((False, True), repeat=3)
+}
+
 
 class SQLiteClinicDB:
     def __init__(self, db_path: str):
@@ -21,15 +113,38 @@ class SQLiteClinicDB:
         if directory:
             os.makedirs(directory, exist_ok=True)
 
-        # Open connection (no schema side effects here)
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        # Open connection (no schema side effects here). The statement cache outlives calls now
+        # that connections are pooled; size it to hold every distinct query shape we issue.
+        # isolation_level=None: single-statement writes autocommit; multi-statement work
+        # goes through transaction() (BEGIN IMMEDIATE ... COMMIT).
+        self.conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            isolation_level=None,
+        )
+        # default tuple rows: every read indexes positionally, so sqlite3.Row's name lookup is unused
         self.cursor = self.conn.cursor()
 
         # Enforce FK constraints in SQLite (per-connection setting)
         self.cursor.execute("PRAGMA foreign_keys = ON;")
+        # Only takes effect for a brand-new file, so it must run before journal_mode below.
+        self.cursor.execute("PRAGMA page_size = 8192;")
+        # Connections are long-lived (pooled by the repository): WAL lets readers and the
+        # writer proceed concurrently, and a larger page cache stays warm across calls.
+        self.cursor.execute("PRAGMA journal_mode = WAL;")
+        self.cursor.execute("PRAGMA synchronous = NORMAL;")
+        self.cursor.execute("PRAGMA temp_store = MEMORY;")
+        self.cursor.execute("PRAGMA cache_size = -65536;")
+        # Read pages straight from the OS page cache instead of copying them in.
+        self.cursor.execute("PRAGMA mmap_size = 268435456;")
 
     def close(self) -> None:
+        try:
+            # refresh planner statistics only where the workload since open made them stale
+            self.conn.execute("PRAGMA optimize;")
+        except sqlite3.Error:
+            pass
         try:
             self.conn.close()
         except Exception:
@@ -41,31 +156,48 @@ class SQLiteClinicDB:
     def __exit__(self, exc_type, exc, tb) -> None:
         self.close()
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several writes into one transaction (one commit instead of one per statement).
+        BEGIN IMMEDIATE takes the write lock up front, so a concurrent writer waits on
+        busy_timeout here rather than failing with SQLITE_BUSY halfway through.
+        """
+        self.cursor.execute("BEGIN IMMEDIATE;")
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
     def init_schema(self, *, seed: bool = True) -> None:
         """
         Ensure schema exists. Safe to call multiple times.
         Optionally seed initial data if DB is empty.
         """
-        self.create_tables()
-        if seed:
-            self.seed_if_empty()
-        self.conn.commit()
+        with self.transaction():
+            self.create_tables()
+            if seed:
+                self.seed_if_empty()
 
     def reset_schema(self, *, seed: bool = True) -> None:
-        # drop in FK-safe order
+        # drop in FK-safe order (foreign_keys can't be toggled inside a transaction)
         self.cursor.execute("PRAGMA foreign_keys = OFF;")
-        self.cursor.execute("DROP TABLE IF EXISTS bills;")
-        self.cursor.execute("DROP TABLE IF EXISTS slots;")
-        self.cursor.execute("DROP TABLE IF EXISTS payment_methods;")
-        self.cursor.execute("DROP TABLE IF EXISTS doctor_opening_days;")
-        self.cursor.execute("DROP TABLE IF EXISTS doctors;")
-        self.cursor.execute("DROP TABLE IF EXISTS users;")
-        self.cursor.execute("PRAGMA foreign_keys = ON;")
-
-        self.create_tables()
-        if seed:
-            self.seed_if_empty()
-        self.conn.commit()
+        try:
+            with self.transaction():
+                self.cursor.execute("DROP TABLE IF EXISTS bills;")
+                self.cursor.execute("DROP TABLE IF EXISTS slots;")
+                self.cursor.execute("DROP TABLE IF EXISTS payment_methods;")
+                self.cursor.execute("DROP TABLE IF EXISTS doctor_opening_days;")
+                self.cursor.execute("DROP TABLE IF EXISTS doctors;")
+                self.cursor.execute("DROP TABLE IF EXISTS users;")
+
+                self.create_tables()
+                if seed:
+                    self.seed_if_empty()
+        finally:
+            self.cursor.execute("PRAGMA foreign_keys = ON;")
 
     def seed_if_empty(self) -> None:
         """
@@ -74,11 +206,13 @@ class SQLiteClinicDB:
         """
         from clinic_mcp_server.clinic.sqlite.populate import populate_repo  # local import avoids circular dependency
 
-        self.cursor.execute("SELECT COUNT(*) AS c FROM doctors")
-        if int(self.cursor.fetchone()["c"]) > 0:
+        self.cursor.execute("SELECT COUNT(*) FROM doctors")
+        if self.cursor.fetchone()[0] > 0:
             return
 
         populate_repo(self)
+        # give the planner statistics for the freshly seeded tables
+        self.cursor.execute("ANALYZE;")
 
     def create_tables(self):
         # Safer table creation order for FK relationships
@@ -155,6 +289,48 @@ class SQLiteClinicDB:
         )
         """)
 
+        self.create_indexes()
+
+    def create_indexes(self) -> None:
+        # search_doctors: equality on specialty, then rating/fee ranges
+        self.cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_doctors_specialty_rating_fee
+            ON doctors (specialty, rating DESC, visit_fee)
+        """)
+        # free slots per doctor in date order: search_available_appointments join
+        # and the next_available_appointment subquery in search_doctors
+        self.cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_slots_free_dr_date
+            ON slots (dr_id, date, start_time)
+            WHERE user_id IS NULL
+        """)
+        # booked slots per user: get_user_appointments (free slots stay out of this index)
+        self.cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_slots_user
+            ON slots (user_id)
+            WHERE user_id IS NOT NULL
+        """)
+        # get_user_payment_methods
+        self.cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_payment_methods_user
+            ON payment_methods (user_id)
+        """)
+        # get_user_id
+        self.cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_users_ssn
+            ON users (social_security_number)
+        """)
+
+    def quick_check(self) -> bool:
+        """Cheap structural integrity check (PRAGMA quick_check)."""
+        self.cursor.execute("PRAGMA quick_check;")
+        return self.cursor.fetchone()[0] == "ok"
+
+    def schema_version(self) -> int:
+        """Schema cookie from the file header; bumped by every CREATE/DROP on any connection."""
+        self.cursor.execute("PRAGMA schema_version;")
+        return self.cursor.fetchone()[0]
+
     def remove_db(self):
         self.close()
         if os.path.exists(self.db_path):
@@ -190,7 +366,6 @@ class SQLiteClinicDB:
             """,
             (social_security_number, first_name, last_name, address, email, phone_number, today, membership_type.value),
         )
-        self.conn.commit()
         return self._require_lastrowid()
 
     def bill_user(self, pay_id: int, amount: float, slot_id: int | None = None) -> int:
@@ -211,7 +386,6 @@ class SQLiteClinicDB:
                 """,
                 (pay_id, slot_id, now, amount),
             )
-        self.conn.commit()
         return self._require_lastrowid()
 
     def add_payment_method(
@@ -229,10 +403,10 @@ class SQLiteClinicDB:
             """,
             (user_id, card_last_4, card_brand, card_exp, card_id),
         )
-        self.conn.commit()
         return self._require_lastrowid()
 
-    def add_appointment(self, user_id: int, slot_id: int) -> int:
+    def add_appointment(self, user_id: int, slot_id: int) -> int | None:
+        """Book the slot; returns None if it is already booked or does not exist."""
         # prevent double booking
         self.cursor.execute("""
             UPDATE slots
@@ -240,10 +414,9 @@ class SQLiteClinicDB:
             WHERE slot_id = ?
               AND user_id IS NULL
         """, (user_id, slot_id))
-        self.conn.commit()
 
         if self.cursor.rowcount != 1:
-            raise ValueError(f"Slot {slot_id} is not available (already booked or does not exist).")
+            return None
 
         return slot_id
 
@@ -253,7 +426,6 @@ class SQLiteClinicDB:
             SET user_id = NULL
             WHERE slot_id = ?
         """, (int(slot_id),))
-        self.conn.commit()
 
     def get_available_dr_specialties(self) -> list[str]:
         self.cursor.execute("""
@@ -262,7 +434,7 @@ class SQLiteClinicDB:
             WHERE specialty IS NOT NULL
             ORDER BY specialty COLLATE NOCASE
         """)
-        return [row[0] for row in self.cursor.fetchall()]
+        return [row[0] for row in self.cursor]
 
     def search_doctors(
         self,
@@ -270,55 +442,29 @@ class SQLiteClinicDB:
         min_rank: float | None = None,
         max_fee: float | None = None,
     ) -> list[DoctorSearchResult]:
-        query = """
-            SELECT
-                d.dr_id,
-                d.dr_name,
-                d.specialty,
-                d.rating,
-                d.visit_fee,
-                (
-                    SELECT MIN(s.date || ' ' || s.start_time)
-                    FROM slots s
-                    WHERE s.dr_id = d.dr_id
-                      AND s.user_id IS NULL
-                      AND datetime(s.date || ' ' || s.start_time) >= datetime('now')
-                ) AS next_available_appointment
-            FROM doctors d
-            WHERE 1=1
-        """
         params: list[object] = []
-
         if specialty:
-            query += " AND d.specialty = ?"
             params.append(specialty)
-
         if min_rank is not None:
-            query += " AND d.rating >= ?"
             params.append(min_rank)
-
         if max_fee is not None:
-            query += " AND d.visit_fee <= ?"
             params.append(max_fee)
 
-        query += " ORDER BY d.rating DESC"
-
+        query = _SEARCH_DOCTORS_SQL[(bool(specialty), min_rank is not None, max_fee is not None)]
         self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
-
-        out: list[DoctorSearchResult] = []
-        for r in rows:
-            out.append(
-                DoctorSearchResult(
-                    dr_id=int(r[0]),
-                    dr_name=str(r[1]),
-                    specialty=str(r[2]),
-                    rating=float(r[3]),
-                    visit_fee=float(r[4]),
-                    next_available_appointment=r[5],
-                )
+
+        # rows come back typed by column affinity (INTEGER/TEXT/REAL): no validation pass needed
+        return [
+            DoctorSearchResult.model_construct(
+                dr_id=r[0],
+                dr_name=r[1],
+                specialty=r[2],
+                rating=r[3],
+                visit_fee=r[4],
+                next_available_appointment=r[5],
             )
-        return out
+            for r in self.cursor
+        ]
 
     def search_available_appointments(
         self,
@@ -327,54 +473,17 @@ class SQLiteClinicDB:
         start_date: str | None = None,
         end_date: str | None = None,
     ) -> list[AppointmentSlot]:
-        base_query = """
-            SELECT
-                s.slot_id,
-                d.dr_name,
-                d.specialty,
-                s.date,
-                s.start_time,
-                s.end_time,
-                d.visit_fee,
-                d.rating
-            FROM slots s
-            JOIN doctors d ON s.dr_id = d.dr_id
-            WHERE d.specialty = ?
-              AND s.user_id IS NULL
-              AND date(s.date) >= date('now')
-        """
         params: list[object] = [specialty]
-
         if doctor_name:
-            base_query += " AND d.dr_name LIKE ?"
             params.append(f"%{doctor_name}%")
-
         if start_date:
-            base_query += " AND date(s.date) >= date(?)"
             params.append(start_date)
-
         if end_date:
-            base_query += " AND date(s.date) <= date(?)"
             params.append(end_date)
 
-        base_query += " ORDER BY s.date ASC, s.start_time ASC LIMIT 10"
-
-        self.cursor.execute(base_query, params)
-        rows = self.cursor.fetchall()
-
-        return [
-            AppointmentSlot(
-                slot_id=int(r[0]),
-                dr_name=str(r[1]),
-                specialty=str(r[2]),
-                date=str(r[3]),
-                start_time=str(r[4]),
-                end_time=str(r[5]),
-                visit_fee=float(r[6]),
-                rating=float(r[7]),
-            )
-            for r in rows
-        ]
+        query = _SEARCH_SLOTS_SQL[(bool(doctor_name), bool(start_date), bool(end_date))]
+        self.cursor.execute(query, params)
+        return [_slot_from_row(r) for r in self.cursor]
 
     def get_user_payment_methods(self, user_id: int) -> list[PaymentMethod]:
         self.cursor.execute("""
@@ -383,19 +492,18 @@ class SQLiteClinicDB:
             WHERE user_id = ?
             ORDER BY pay_id ASC
         """, (user_id,))
-        rows = self.cursor.fetchall()
         return [
-            PaymentMethod(
-                pay_id=int(r[0]),
-                card_last_4=int(r[1]),
-                card_brand=str(r[2]),
-                card_exp=str(r[3]),
-                card_id=str(r[4]),
+            PaymentMethod.model_construct(
+                pay_id=r[0],
+                card_last_4=r[1],
+                card_brand=r[2],
+                card_exp=r[3],
+                card_id=r[4],
             )
-            for r in rows
+            for r in self.cursor
         ]
 
-    def get_user_id(self, social_security_number: int) -> int:
+    def get_user_id(self, social_security_number: int) -> int | None:
         self.cursor.execute("""
             SELECT user_id
             FROM users
@@ -403,10 +511,10 @@ class SQLiteClinicDB:
         """, (social_security_number,))
         row = self.cursor.fetchone()
         if not row:
-            raise ValueError(f"No user found with social security number: {social_security_number}")
+            return None
         return int(row[0])
 
-    def get_user(self, user_id: int) -> User:
+    def get_user(self, user_id: int) -> User | None:
         self.cursor.execute("""
             SELECT
                 u.user_id,
@@ -423,62 +531,34 @@ class SQLiteClinicDB:
         """, (user_id,))
         r = self.cursor.fetchone()
         if not r:
-            raise ValueError(f"No user found with id: {user_id}")
+            return None
 
-        return User(
+        # user_id is exposed as str and membership as the enum; the rest is already typed
+        return User.model_construct(
             user_id=str(r[0]),
-            ssn=int(r[1]),
-            first_name=str(r[2]),
-            last_name=str(r[3]),
-            address=str(r[4]),
-            email=str(r[5]),
-            phone=str(r[6]),
-            enter_date=str(r[7]),
-            membership_type=MembershipType(r[8]),
+            ssn=r[1],
+            first_name=r[2],
+            last_name=r[3],
+            address=r[4],
+            email=r[5],
+            phone=r[6],
+            enter_date=r[7],
+            membership_type=_MEMBERSHIP_BY_VALUE[r[8]],
         )
 
     def get_user_appointments(self, user_id: int) -> list[AppointmentSlot]:
-        self.cursor.execute("""
-            SELECT
-                s.slot_id,
-                d.dr_name,
-                d.specialty,
-                s.date,
-                s.start_time,
-                s.end_time,
-                d.visit_fee,
-                d.rating
+        self.cursor.execute(f"""
+            SELECT {_SLOT_COLUMNS}
             FROM slots s
             JOIN doctors d ON s.dr_id = d.dr_id
             WHERE s.user_id = ?
             ORDER BY s.date ASC, s.start_time ASC
         """, (user_id,))
-        rows = self.cursor.fetchall()
-        return [
-            AppointmentSlot(
-                slot_id=int(r[0]),
-                dr_name=str(r[1]),
-                specialty=str(r[2]),
-                date=str(r[3]),
-                start_time=str(r[4]),
-                end_time=str(r[5]),
-                visit_fee=float(r[6]),
-                rating=float(r[7]),
-            )
-            for r in rows
-        ]
+        return [_slot_from_row(r) for r in self.cursor]
 
     def get_appointment_slot(self, slot_id: int) -> AppointmentSlot | None:
-        self.cursor.execute("""
-            SELECT
-                s.slot_id,
-                d.dr_name,
-                d.specialty,
-                s.date,
-                s.start_time,
-                s.end_time,
-                d.visit_fee,
-                d.rating
+        self.cursor.execute(f"""
+            SELECT {_SLOT_COLUMNS}
             FROM slots s
             JOIN doctors d ON s.dr_id = d.dr_id
             WHERE s.slot_id = ?
@@ -487,15 +567,6 @@ class SQLiteClinicDB:
         if not r:
             return None
 
-        return AppointmentSlot(
-            slot_id=int(r[0]),
-            dr_name=str(r[1]),
-            specialty=str(r[2]),
-            date=str(r[3]),
-            start_time=str(r[4]),
-            end_time=str(r[5]),
-            visit_fee=float(r[6]),
-            rating=float(r[7]),
-        )
+        return _slot_from_row(r)
 
 # Made with Bob
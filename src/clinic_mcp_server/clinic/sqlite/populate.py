@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -8,11 +8,13 @@ if TYPE_CHECKING:
 
 
 def populate_repo(db: SQLiteClinicDB) -> None:
-    """Seed doctors, their schedules, appointment slots, and demo users into the database."""
+    """
+    Seed doctors, their schedules, appointment slots, and demo users into the database.
+    Runs inside the caller's transaction; the caller commits.
+    """
     _add_doctors(db)
     _add_slots(db)
     _add_users(db)
-    db.conn.commit()
 
 
 def _add_doctors(db: SQLiteClinicDB) -> None:
@@ -34,58 +36,64 @@ def _add_doctors(db: SQLiteClinicDB) -> None:
         (2, "09:00", "13:00"),  # Wednesday
     ]
 
-    for doc in doctors:
-        db.cursor.execute(
-            "INSERT INTO doctors (dr_name, slot_visiting_time, visit_fee, specialty, rating) VALUES (?, ?, ?, ?, ?)",
-            doc,
-        )
-        dr_id = db.cursor.lastrowid
-
-        for weekday, start_time, end_time in default_schedule:
-            db.cursor.execute(
-                "INSERT INTO doctor_opening_days (dr_id, weekday, start_time, end_time) VALUES (?, ?, ?, ?)",
-                (dr_id, weekday, start_time, end_time),
-            )
+    db.cursor.executemany(
+        "INSERT INTO doctors (dr_name, slot_visiting_time, visit_fee, specialty, rating) VALUES (?, ?, ?, ?, ?)",
+        doctors,
+    )
+
+    # Only runs against an empty doctors table, so every doctor gets the default schedule;
+    # fanning out in SQL avoids needing each generated dr_id back in Python.
+    db.cursor.executemany(
+        """
+        INSERT INTO doctor_opening_days (dr_id, weekday, start_time, end_time)
+        SELECT dr_id, ?, ?, ? FROM doctors ORDER BY dr_id
+        """,
+        default_schedule,
+    )
+
+
+# Expands every doctor's opening hours into bookable slots entirely inside SQLite.
+# Params: from_date (YYYY-MM-DD), days_range, days_range.
+# Weekdays follow Python's date.weekday() (0 = Monday); strftime('%w') counts from Sunday.
+_GENERATE_SLOTS_SQL = """
+    WITH RECURSIVE
+    days(n, day) AS (
+        SELECT 0, date(?) WHERE ? > 0
+        UNION ALL
+        SELECT n + 1, date(day, '+1 day') FROM days WHERE n + 1 < ?
+    ),
+    spans(dr_id, day, start_min, end_min, step) AS (
+        SELECT d.dr_id,
+               days.day,
+               CAST(substr(od.start_time, 1, 2) AS INTEGER) * 60 + CAST(substr(od.start_time, 4, 2) AS INTEGER),
+               CAST(substr(od.end_time, 1, 2) AS INTEGER) * 60 + CAST(substr(od.end_time, 4, 2) AS INTEGER),
+               d.slot_visiting_time
+        FROM doctors d
+        JOIN doctor_opening_days od ON d.dr_id = od.dr_id
+        JOIN days ON (CAST(strftime('%w', days.day) AS INTEGER) + 6) % 7 = od.weekday
+    ),
+    starts(dr_id, day, m, end_min, step) AS (
+        SELECT dr_id, day, start_min, end_min, step FROM spans WHERE start_min + step <= end_min
+        UNION ALL
+        SELECT dr_id, day, m + step, end_min, step FROM starts WHERE m + 2 * step <= end_min
+    )
+    INSERT INTO slots (dr_id, date, start_time, end_time)
+    SELECT dr_id,
+           day,
+           printf('%02d:%02d', m / 60, m % 60),
+           printf('%02d:%02d', (m + step) / 60, (m + step) % 60)
+    FROM starts
+    ORDER BY dr_id, day, m
+"""
 
 
 def _add_slots(db: SQLiteClinicDB, days_range: int = 30, from_date: date | None = None) -> None:
+    # from_date is resolved here (local date), not with SQLite's UTC date('now')
     if from_date is None:
         from_date = datetime.today().date()
 
-    db.cursor.execute("""
-        SELECT d.dr_id, d.slot_visiting_time, od.weekday, od.start_time, od.end_time
-        FROM doctors d
-        JOIN doctor_opening_days od ON d.dr_id = od.dr_id
-    """)
-    schedule = db.cursor.fetchall()
-
-    for row in schedule:
-        dr_id = row["dr_id"]
-        slot_minutes = row["slot_visiting_time"]
-        weekday = row["weekday"]
-        start_str = row["start_time"]
-        end_str = row["end_time"]
-
-        for day_offset in range(days_range):
-            slot_date = from_date + timedelta(days=day_offset)
-            if slot_date.weekday() != weekday:
-                continue
-
-            slot_duration = timedelta(minutes=slot_minutes)
-            start_dt = datetime.strptime(f"{slot_date} {start_str}", "%Y-%m-%d %H:%M")
-            end_dt = datetime.strptime(f"{slot_date} {end_str}", "%Y-%m-%d %H:%M")
-
-            while start_dt + slot_duration <= end_dt:
-                db.cursor.execute("""
-                    INSERT INTO slots (dr_id, date, start_time, end_time)
-                    VALUES (?, ?, ?, ?)
-                """, (
-                    dr_id,
-                    slot_date.isoformat(),
-                    start_dt.strftime("%H:%M"),
-                    (start_dt + slot_duration).strftime("%H:%M"),
-                ))
-                start_dt += slot_duration
+    db.cursor.execute(_GENERATE_SLOTS_SQL, (from_date.isoformat(), days_range, days_range))
+
 
 def _add_users(db: SQLiteClinicDB) -> None:
     """Seed a small set of demo users with payment methods and an initial membership bill."""
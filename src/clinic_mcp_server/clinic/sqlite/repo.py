@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from clinic_mcp_server.clinic.domain.data_types import AppointmentSlot, DoctorSearchResult, MembershipType, PaymentMethod, User
@@ -12,32 +16,95 @@ from clinic_mcp_server.clinic.domain.data_types import (
 from clinic_mcp_server.clinic.domain.repo import ClinicRepository
 from .db import SQLiteClinicDB
 
+DEFAULT_DB_PATH = "data/clinic.db"
 
 class SQLiteClinicRepository(ClinicRepository):
     def __init__(self, db_path: str):
         self._db_path = db_path
+        # One warm connection per thread, reused across calls instead of reconnecting.
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._pool: list[SQLiteClinicDB] = []
+        # WAL lets every thread's connection read in parallel, but SQLite admits one writer
+        # at a time; queueing writers here avoids busy-handler sleep/retry on the file lock.
+        # Re-entrant so writes can run inside transaction() on the same thread.
+        self._write_lock = threading.RLock()
+        # Specialties served from memory, tagged with the schema version they were read at.
+        # Doctors are only written when seeding freshly created tables, and any reset
+        # (from this or another repository / process) drops and recreates them, which bumps
+        # the version. Users are not cached: a reset restarts AUTOINCREMENT, so an id can
+        # come back belonging to someone else.
+        self._specialties: tuple[int, list[str]] | None = None
+
+    def _invalidate_caches(self) -> None:
+        self._specialties = None
 
     def init_schema(self) -> None:
         with SQLiteClinicDB(self._db_path) as db:
             db.init_schema(seed=True)
-
-    def _db(self) -> SQLiteClinicDB:
-        return SQLiteClinicDB(self._db_path)
-
+        self._invalidate_caches()
+
+    @contextmanager
+    def _db(self) -> Iterator[SQLiteClinicDB]:
+        db: SQLiteClinicDB | None = getattr(self._local, "db", None)
+        if db is None:
+            db = SQLiteClinicDB(self._db_path)
+            self._local.db = db
+            with self._pool_lock:
+                self._pool.append(db)
+        try:
+            yield db
+        except BaseException:
+            # never hand a half-finished transaction to the next caller
+            db.conn.rollback()
+            raise
+
+    @contextmanager
+    def _write_db(self) -> Iterator[SQLiteClinicDB]:
+        with self._write_lock, self._db() as db:
+            yield db
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run several repository writes on this thread's connection as one transaction."""
+        with self._write_lock, self._db() as db, db.transaction():
+            yield
+
+    def close(self) -> None:
+        """Close all pooled connections. The pool is lazily refilled on next use."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+            self._local = threading.local()
+        for db in pool:
+            db.close()
+
+
+    def _db_is_healthy(self) -> bool:
+        try:
+            with SQLiteClinicDB(self._db_path) as db:
+                return db.quick_check()
+        except sqlite3.DatabaseError:
+            return False
 
     def hard_reset_database(self) -> None:
         """
-        Delete SQLite DB file and recreate schema (+ optional seed).
+        Reset schema in place (DROP+CREATE+seed). Only if the DB fails an integrity
+        check is the SQLite file deleted and the schema bootstrapped from scratch.
         Deterministic and safest for demos/tests.
         """
+        if self._db_is_healthy():
+            self.reset_database(seed=True)
+            return
+
         db_path = Path(self._db_path)
         if db_path.parent and str(db_path.parent) != ".":
             db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if db_path.exists():
-            # ensure no open connection is holding the file
-            # (ClinicDB context manager closes connections per call)
-            os.remove(db_path)
+        # ensure no pooled connection is holding the file
+        self.close()
+        for path in (db_path, Path(f"{db_path}-wal"), Path(f"{db_path}-shm")):
+            if path.exists():
+                os.remove(path)
 
         # bootstrap
         self.init_schema()
@@ -46,6 +113,7 @@ class SQLiteClinicRepository(ClinicRepository):
     def reset_database(self, *, seed: bool = True) -> None:
         with SQLiteClinicDB(self._db_path) as db:
             db.reset_schema(seed=seed)
+        self._invalidate_caches()
 
 
     # ---- Users ----
@@ -60,7 +128,7 @@ class SQLiteClinicRepository(ClinicRepository):
         membership_type: MembershipType
     ) -> int:
         try:
-            with self._db() as db:
+            with self._write_db() as db:
                 return db.add_user(
                     social_security_number,
                     first_name,
@@ -73,25 +141,26 @@ class SQLiteClinicRepository(ClinicRepository):
         except ValueError as e:
             raise ValidationError(str(e)) from e
 
+    # Not-found / conflict come back from SQLiteClinicDB as None, so the common path needs no try/except.
     def get_user_id(self, social_security_number: int) -> int:
-        try:
-            with self._db() as db:
-                return db.get_user_id(social_security_number)
-        except ValueError as e:
-            raise NotFoundError(str(e)) from e
+        with self._db() as db:
+            user_id = db.get_user_id(social_security_number)
+        if user_id is None:
+            raise NotFoundError(f"No user found with social security number: {social_security_number}")
+        return user_id
 
     def get_user(self, user_id: int) -> User:
-        try:
-            with self._db() as db:
-                return db.get_user(user_id)
-        except ValueError as e:
-            raise NotFoundError(str(e)) from e
+        with self._db() as db:
+            user = db.get_user(user_id)
+        if user is None:
+            raise NotFoundError(f"No user found with id: {user_id}")
+        return user
 
     # ---- Payments ----
     def add_payment_method(
         self, user_id: int, card_last_4: int, card_brand: str, card_exp: str, card_id: str
     ) -> int:
-        with self._db() as db:
+        with self._write_db() as db:
             return db.add_payment_method(user_id, card_last_4, card_brand, card_exp, card_id)
 
     def get_user_payment_methods(self, user_id: int) -> list[PaymentMethod]:
@@ -99,13 +168,21 @@ class SQLiteClinicRepository(ClinicRepository):
             return db.get_user_payment_methods(user_id)
 
     def bill_user(self, pay_id: int, amount: float, slot_id: int | None = None) -> int:
-        with self._db() as db:
+        with self._write_db() as db:
             return db.bill_user(pay_id, amount, slot_id)
 
     # ---- Doctors & slots ----
     def get_available_dr_specialties(self) -> list[str]:
         with self._db() as db:
-            return db.get_available_dr_specialties()
+            version = db.schema_version()
+            cached = self._specialties
+            if cached is not None and cached[0] == version:
+                return list(cached[1])
+            specialties = db.get_available_dr_specialties()
+        # empty tables may still be seeded later without a schema change; don't pin that
+        if specialties:
+            self._specialties = (version, specialties)
+        return list(specialties)
 
     def search_doctors(
         self, specialty: str | None = None, min_rank: float | None = None, max_fee: float | None = None
@@ -128,15 +205,14 @@ class SQLiteClinicRepository(ClinicRepository):
             return db.get_appointment_slot(slot_id)
 
     def add_appointment(self, user_id: int, slot_id: int) -> int:
-        try:
-            with self._db() as db:
-                return db.add_appointment(user_id, slot_id)
-        except ValueError as e:
-            # your DB raises ValueError when slot not available
-            raise ConflictError(str(e)) from e
+        with self._write_db() as db:
+            booked = db.add_appointment(user_id, slot_id)
+        if booked is None:
+            raise ConflictError(f"Slot {slot_id} is not available (already booked or does not exist).")
+        return booked
 
     def remove_appointment(self, slot_id: int) -> None:
-        with self._db() as db:
+        with self._write_db() as db:
             db.remove_appointment(slot_id)
 
     def get_user_appointments(self, user_id: int) -> list[AppointmentSlot]:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 import os
-from functools import lru_cache
+import threading
+from collections.abc import Callable
+from functools import wraps
 from typing import Annotated, Optional
 
 from fastmcp import FastMCP
+from fastmcp.tools import FunctionTool
 from pydantic import BaseModel, Field
 
 from clinic_mcp_server.clinic.domain.data_types import CardBrand, MembershipType
@@ -17,20 +20,54 @@ from clinic_mcp_server.clinic.domain.data_types import (
     User,
 )
 from clinic_mcp_server.clinic.clinic_service import ClinicService
-from clinic_mcp_server.clinic.sqlite import SQLiteClinicRepository
+from clinic_mcp_server.clinic.sqlite.repo import DEFAULT_DB_PATH, SQLiteClinicRepository
 
-DEFAULT_DB_PATH = "data/clinic.db"
+_ALLOWED_MEMBERSHIPS: tuple[str, ...] = tuple(m.value for m in MembershipType)
 
-@lru_cache(maxsize=1)
-def get_service() -> ClinicService:
-    db_path = os.getenv("CLINIC_DB_PATH", DEFAULT_DB_PATH)
-    repo = SQLiteClinicRepository(db_path=db_path)
-    repo.init_schema()  # do once
-    return ClinicService(repo)
+# Created on first use and shared by every tool (admin ones included). The first call is
+# serialized: neither lru_cache nor a bare global check stops two threads that both miss
+# from each building (and init_schema-ing) their own repository.
+_init_lock = threading.Lock()
+_repo: SQLiteClinicRepository | None = None
+_service: ClinicService | None = None
+
+
+def get_repo() -> SQLiteClinicRepository:
+    global _repo
+    repo = _repo
+    if repo is None:
+        with _init_lock:
+            repo = _repo
+            if repo is None:
+                # CLINIC_DB_PATH is read once
+                repo = SQLiteClinicRepository(db_path=os.getenv("CLINIC_DB_PATH", DEFAULT_DB_PATH))
+                repo.init_schema()  # do once
+                _repo = repo
+    return repo
+
+
+def close_repo() -> None:
+    """Close the shared repository's pooled connections, if it was ever opened (shutdown)."""
+    if _repo is not None:
+        _repo.close()
 
 
+def get_service() -> ClinicService:
+    # every tool call goes through here: after the first call this is a single global read
+    global _service
+    service = _service
+    if service is None:
+        repo = get_repo()
+        with _init_lock:
+            service = _service
+            if service is None:
+                service = _service = ClinicService(repo)
+    return service
+
+
+# The DB is opened (and seeded if empty) by the first tool call, not at import: importing
+# this module to register tools stays free of filesystem side effects and startup is faster.
 mcp = FastMCP()
-get_service() # initialize the db
 
 class AddUserResult(BaseModel):
     """Result of creating a user."""
@@ -52,7 +89,28 @@ class OkResult(BaseModel):
     ok: bool = Field(description="True if operation succeeded")
 
 
-@mcp.tool()
+def clinic_tool[**P, R](fn: Callable[P, R]) -> FunctionTool:
+    """
+    Register fn as an MCP tool, reporting domain errors to the client as
+    ValueError("<code>: <message>"). The wrapper keeps fn's name, docstring and
+    signature, so the generated tool schema is unchanged.
+    """
+    @wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            return fn(*args, **kwargs)
+        except ClinicError as e:
+            raise ValueError(f"{e.code}: {e}") from e
+
+    return mcp.tool()(wrapper)
+
+
+# Result models wrap ids the service already returns as ints, so they are built with
+# model_construct (no validation); the success result is constant and shared.
+_OK = OkResult(ok=True)
+
+
+@clinic_tool
 def add_user(
     social_security_number: Annotated[
         int,
@@ -128,17 +186,15 @@ def add_user(
             amount,
             membership_type,
         )
-        return AddUserResult(user_id=result.user_id)
+        return AddUserResult.model_construct(user_id=result.user_id)
     except ValueError as ve:
         raise ValueError(
             f"Invalid membership_type '{membership_type}'. "
-            f"Allowed: {[m.value for m in MembershipType]}"
+            f"Allowed: {list(_ALLOWED_MEMBERSHIPS)}"
         ) from ve
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
 
 
-@mcp.tool()
+@clinic_tool
 def add_payment_method(
     user_id: Annotated[int, Field(description="Existing user id.", gt=0)],
     card_last_4: Annotated[int, Field(description="Last 4 digits of the card.", ge=0, le=9999)],
@@ -152,14 +208,11 @@ def add_payment_method(
     Returns the created payment method id.
     """
     svc = get_service()
-    try:
-        pm_id = svc.add_payment_method(user_id, card_last_4, card_brand.value, card_exp, card_id)
-        return AddPaymentMethodResult(payment_method_id=pm_id)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    pm_id = svc.add_payment_method(user_id, card_last_4, card_brand.value, card_exp, card_id)
+    return AddPaymentMethodResult.model_construct(payment_method_id=pm_id)
 
 
-@mcp.tool()
+@clinic_tool
 def get_user_payment_methods(
     user_id: Annotated[int, Field(description="User id to retrieve payment methods for.", gt=0)]
 ) -> list[PaymentMethod]:
@@ -169,25 +222,19 @@ def get_user_payment_methods(
     Returns a list of PaymentMethod objects.
     """
     svc = get_service()
-    try:
-        return svc.get_user_payment_methods(user_id)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    return svc.get_user_payment_methods(user_id)
 
 
-@mcp.tool()
+@clinic_tool
 def get_available_dr_specialties() -> list[str]:
     """
     Get a list of all supported doctor specialties.
     """
     svc = get_service()
-    try:
-        return svc.list_specialties()
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    return svc.list_specialties()
 
 
-@mcp.tool()
+@clinic_tool
 def search_doctors(
     specialty: Annotated[Optional[str], Field(description="Filter by specialty (exact match).")] = None,
     min_rank: Annotated[Optional[float], Field(description="Minimum doctor rank (inclusive).", ge=0, le=5)] = None,
@@ -199,13 +246,10 @@ def search_doctors(
     You can filter by specialty, rank range and/or fee upper bound.
     """
     svc = get_service()
-    try:
-        return svc.search_doctors(specialty, min_rank, max_fee)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    return svc.search_doctors(specialty, min_rank, max_fee)
 
 
-@mcp.tool()
+@clinic_tool
 def search_available_appointments(
     specialty: Annotated[str, Field(description="Required specialty to search appointments for.")],
     doctor_name: Annotated[Optional[str], Field(description="Optional doctor name filter (substring match).")] = None,
@@ -224,13 +268,10 @@ def search_available_appointments(
     Dates are expected in YYYY-MM-DD format.
     """
     svc = get_service()
-    try:
-        return svc.search_appointments(specialty, doctor_name, start_date, end_date)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    return svc.search_appointments(specialty, doctor_name, start_date, end_date)
 
 
-@mcp.tool()
+@clinic_tool
 def get_appointment_slot(
     slot_id: Annotated[int, Field(description="Appointment slot id.", gt=0)]
 ) -> Optional[AppointmentSlot]:
@@ -240,13 +281,10 @@ def get_appointment_slot(
     Returns the slot or null if not found.
     """
     svc = get_service()
-    try:
-        return svc.get_slot(slot_id)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    return svc.get_slot(slot_id)
 
 
-@mcp.tool()
+@clinic_tool
 def schedule_appointment(
     user_id: Annotated[int, Field(description="User id scheduling the appointment.", gt=0)],
     pay_id: Annotated[int, Field(description="Payment method id to charge.", gt=0)],
@@ -259,14 +297,11 @@ def schedule_appointment(
     Returns the created appointment id.
     """
     svc = get_service()
-    try:
-        appt_id = svc.schedule_appointment(user_id, pay_id, slot_id, payment_amount)
-        return ScheduleAppointmentResult(appointment_id=appt_id)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    appt_id = svc.schedule_appointment(user_id, pay_id, slot_id, payment_amount)
+    return ScheduleAppointmentResult.model_construct(appointment_id=appt_id)
 
 
-@mcp.tool()
+@clinic_tool
 def remove_appointment(
     slot_id: Annotated[int, Field(description="Appointment slot id to cancel.", gt=0)]
 ) -> OkResult:
@@ -274,14 +309,11 @@ def remove_appointment(
     Cancel an appointment by slot id.
     """
     svc = get_service()
-    try:
-        svc.cancel_appointment(slot_id)
-        return OkResult(ok=True)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    svc.cancel_appointment(slot_id)
+    return _OK
 
 
-@mcp.tool()
+@clinic_tool
 def get_user_appointments(
     user_id: Annotated[int, Field(description="User id to list appointments for.", gt=0)]
 ) -> list[AppointmentSlot]:
@@ -289,13 +321,10 @@ def get_user_appointments(
     List appointments for a user.
     """
     svc = get_service()
-    try:
-        return svc.get_user_appointments(user_id)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    return svc.get_user_appointments(user_id)
 
 
-@mcp.tool()
+@clinic_tool
 def get_user_id(
     social_security_number: Annotated[int, Field(description="User national identifier / SSN (digits only).")]
 ) -> int:
@@ -303,13 +332,10 @@ def get_user_id(
     Resolve internal user id by social security number.
     """
     svc = get_service()
-    try:
-        return svc.get_user_id(social_security_number)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    return svc.get_user_id(social_security_number)
 
 
-@mcp.tool()
+@clinic_tool
 def get_user(
     user_id: Annotated[int, Field(description="User id to retrieve.", gt=0)]
 ) -> User:
@@ -317,10 +343,7 @@ def get_user(
     Retrieve a user record by id.
     """
     svc = get_service()
-    try:
-        return svc.get_user(user_id)
-    except ClinicError as e:
-        raise ValueError(f"{e.code}: {e}") from e
+    return svc.get_user(user_id)
 
 
 @mcp.tool()
@@ -330,10 +353,13 @@ def admin_reset_db() -> OkResult:
 
     Warning: This deletes all data.
     """
-    repo = SQLiteClinicRepository(db_path=os.getenv("CLINIC_DB_PATH", DEFAULT_DB_PATH))
-    repo.reset_database()
-    return OkResult(ok=True)
+    # resetting through the shared repository also clears its cached lookups
+    get_repo().reset_database()
+    return _OK
 
 
 if __name__ == "__main__":
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        close_repo()
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import hashlib
 import hmac
 import json
 import time
+from collections import OrderedDict
 from typing import Any
 
+_VERIFIED_CACHE_SIZE = 1024
+_NO_EXP_CACHE_SECONDS = 60
+# base64 padding indexed by len(data) % 4
+_B64_PADDING = ("", "===", "==", "=")
+_URLSAFE_TO_STD = bytes.maketrans(b"-_", b"+/")
+
 
 class JwtHS256:
     """
@@ -18,6 +26,11 @@ class JwtHS256:
         self.secret = secret
         self.audience = audience
         self.issuer = issuer
+        # Keyed HMAC state is derived once; each signature copies it.
+        self._hmac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._header_b64 = self._b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+        # token -> (cache deadline, verified claims); bounded LRU
+        self._verified: OrderedDict[str, tuple[int, dict[str, Any]]] = OrderedDict()
 
     @staticmethod
     def _b64url_encode(raw: bytes) -> str:
@@ -25,15 +38,18 @@ class JwtHS256:
 
     @staticmethod
     def _b64url_decode(data: str) -> bytes:
-        padding = "=" * (-len(data) % 4)
-        return base64.urlsafe_b64decode(data + padding)
+        # what urlsafe_b64decode does, minus its per-call argument checks; errors stay ValueError
+        return binascii.a2b_base64((data + _B64_PADDING[len(data) & 3]).encode("ascii").translate(_URLSAFE_TO_STD))
+
+    def _digest(self, signing_input: bytes) -> bytes:
+        h = self._hmac.copy()
+        h.update(signing_input)
+        return h.digest()
 
     def _sign(self, signing_input: bytes) -> str:
-        sig = hmac.new(self.secret.encode("utf-8"), signing_input, hashlib.sha256).digest()
-        return self._b64url_encode(sig)
+        return self._b64url_encode(self._digest(signing_input))
 
     def generate_demo_token(self, valid_seconds: int = 24 * 3600) -> str:
-        header = {"alg": "HS256", "typ": "JWT"}
         now = int(time.time())
         payload: dict[str, Any] = {
             "sub": "demo-user",
@@ -46,30 +62,42 @@ class JwtHS256:
         if self.issuer:
             payload["iss"] = self.issuer
 
-        header_b64 = self._b64url_encode(json.dumps(header, separators=(",", ":")).encode("utf-8"))
+        header_b64 = self._header_b64
         payload_b64 = self._b64url_encode(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
         signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
         sig_b64 = self._sign(signing_input)
         return f"{header_b64}.{payload_b64}.{sig_b64}"
 
     def verify(self, token: str, leeway_seconds: int = 30) -> dict[str, Any]:
+        now = int(time.time())
+        hit = self._verified.get(token)
+        if hit is not None:
+            deadline, claims = hit
+            if now <= deadline + leeway_seconds:
+                self._verified.move_to_end(token)
+                return dict(claims)
+            del self._verified[token]
+
         parts = token.split(".")
         if len(parts) != 3:
             raise ValueError("Invalid JWT format")
 
-        header = json.loads(self._b64url_decode(parts[0]).decode("utf-8"))
+        # tokens we issued carry our exact header; only foreign encodings need parsing
+        if parts[0] != self._header_b64:
+            header = json.loads(self._b64url_decode(parts[0]).decode("utf-8"))
+            if header.get("alg") != "HS256":
+                raise ValueError("Only HS256 supported in this demo")
+
         payload = json.loads(self._b64url_decode(parts[1]).decode("utf-8"))
         signature_b64 = parts[2]
-        signing_input = f"{parts[0]}.{parts[1]}".encode("ascii")
-
-        if header.get("alg") != "HS256":
-            raise ValueError("Only HS256 supported in this demo")
+        signing_input = token[: len(parts[0]) + 1 + len(parts[1])].encode("ascii")
 
-        expected = self._sign(signing_input)
-        if not hmac.compare_digest(expected, signature_b64):
+        # compare the canonical encoding, not decoded bytes: lenient base64 decoding would
+        # accept many spellings (junk characters, unused low bits) of one valid signature
+        expected = self._sign(signing_input).encode("ascii")
+        if not hmac.compare_digest(expected, signature_b64.encode("utf-8")):
             raise ValueError("Invalid JWT signature")
 
-        now = int(time.time())
         exp = payload.get("exp")
         if isinstance(exp, int) and now > exp + leeway_seconds:
             raise ValueError("JWT expired")
@@ -84,4 +112,8 @@ class JwtHS256:
         if self.issuer is not None and payload.get("iss") != self.issuer:
             raise ValueError("JWT issuer mismatch")
 
+        deadline = exp if isinstance(exp, int) else now + _NO_EXP_CACHE_SECONDS
+        self._verified[token] = (deadline, dict(payload))
+        if len(self._verified) > _VERIFIED_CACHE_SIZE:
+            self._verified.popitem(last=False)
         return payload
@@ -5,6 +5,11 @@ from collections.abc import Iterable
 
 from clinic_mcp_server.mcp.auth.jwt_hs256 import JwtHS256
 
+# 401 responses are constant: build the ASGI messages once, not per rejected request.
+_UNAUTHORIZED_START = {"type": "http.response.start", "status": 401, "headers": []}
+_MISSING_TOKEN_BODY = {"type": "http.response.body", "body": b'{"error":"missing bearer token"}'}
+_INVALID_TOKEN_BODY = {"type": "http.response.body", "body": b'{"error":"invalid token"}'}
+
 
 class JwtAuthMiddleware:
     """
@@ -23,31 +28,40 @@ class JwtAuthMiddleware:
         self.app = app
         self.jwt = jwt
         self.required = required
-        self.allowlist_paths = tuple(allowlist_paths)
+        # exact paths hash-match; entries ending in "*" (e.g. "/health/*") match by prefix
+        paths = tuple(allowlist_paths)
+        self.allowlist_paths = frozenset(p for p in paths if not p.endswith("*"))
+        self.allowlist_prefixes = tuple(p[:-1] for p in paths if p.endswith("*"))
 
     async def __call__(self, scope, receive, send):
-        if scope.get("type") != "http":
+        # lifespan/websocket pass straight through; ASGI guarantees the "type" key
+        if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
         path = scope.get("path") or ""
-        if (not self.required) or (path in self.allowlist_paths):
+        if (not self.required) or (path in self.allowlist_paths) or path.startswith(self.allowlist_prefixes):
             await self.app(scope, receive, send)
             return
 
-        headers = {k.decode().lower(): v.decode() for k, v in (scope.get("headers") or [])}
-        auth = headers.get("authorization", "")
-        if not auth.lower().startswith("bearer "):
-            await send({"type": "http.response.start", "status": 401, "headers": []})
-            await send({"type": "http.response.body", "body": b'{"error":"missing bearer token"}'})
+        # ASGI header names are already lower-cased bytes; only the one we need is looked at
+        auth = b""
+        for name, value in scope.get("headers") or ():
+            if name == b"authorization":
+                auth = value
+                break
+        # lower-case only the 7-byte scheme, not the whole (token-sized) header value
+        if auth[:7].lower() != b"bearer ":
+            await send(_UNAUTHORIZED_START)
+            await send(_MISSING_TOKEN_BODY)
             return
 
-        token = auth.split(" ", 1)[1].strip()
+        token = auth[7:].strip().decode("latin-1")
         try:
             self.jwt.verify(token)
         except Exception:
-            await send({"type": "http.response.start", "status": 401, "headers": []})
-            await send({"type": "http.response.body", "body": b'{"error":"invalid token"}'})
+            await send(_UNAUTHORIZED_START)
+            await send(_INVALID_TOKEN_BODY)
             return
 
         await self.app(scope, receive, send)
@@ -22,39 +22,39 @@ class HealthMountApp:
         self._settings = settings
         self._mounted = mounted
 
+        # Settings are immutable after boot, so the health response is built once.
+        payload = {
+            "status": "ok",
+            "transport": settings.transport,
+            "host": settings.host,
+            "port": settings.port,
+            "mcp_path": settings.mcp_path,
+            "sse_path": settings.sse_path,
+            "jwt_required": settings.jwt_required,
+            "jwt_allowlist_paths": sorted(settings.jwt_allowlist_paths),
+        }
+        body = json.dumps(payload).encode("utf-8")
+        self._health_start = {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json; charset=utf-8"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"cache-control", b"no-store"),
+            ],
+        }
+        self._health_body = {"type": "http.response.body", "body": body}
+
     async def __call__(self, scope, receive, send) -> None:
         if scope["type"] != "http":
             await self._mounted(scope, receive, send)
             return
 
-        path = scope.get("path", "")
-        method = scope.get("method", "GET").upper()
-
-        if path == "/health" and method == "GET":
-            payload = {
-                "status": "ok",
-                "transport": self._settings.transport,
-                "host": self._settings.host,
-                "port": self._settings.port,
-                "mcp_path": self._settings.mcp_path,
-                "sse_path": self._settings.sse_path,
-                "jwt_required": self._settings.jwt_required,
-                "jwt_allowlist_paths": list(self._settings.jwt_allowlist_paths),
-            }
-            body = json.dumps(payload).encode("utf-8")
-
-            await send(
-                {
-                    "type": "http.response.start",
-                    "status": 200,
-                    "headers": [
-                        (b"content-type", b"application/json; charset=utf-8"),
-                        (b"content-length", str(len(body)).encode("ascii")),
-                        (b"cache-control", b"no-store"),
-                    ],
-                }
-            )
-            await send({"type": "http.response.body", "body": body})
+        # "path" and "method" are required HTTP scope keys, and ASGI servers send the method
+        # upper-cased; check the path first since almost every request is not a probe
+        if scope["path"] == "/health" and scope["method"] == "GET":
+            await send(self._health_start)
+            await send(self._health_body)
             return
 
         await self._mounted(scope, receive, send)
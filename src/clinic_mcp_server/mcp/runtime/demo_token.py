@@ -4,6 +4,9 @@ from __future__ import annotations
 from clinic_mcp_server.mcp.auth.jwt_hs256 import JwtHS256
 from clinic_mcp_server.mcp.runtime.settings import ServerSettings
 
+_RULE = "=" * 80
+_DIVIDER = "-" * 80
+
 
 def _client_host(host: str) -> str:
     """Convert bind-all addresses into a client-friendly host for examples."""
@@ -17,8 +20,7 @@ def _base_url(host: str, port: int) -> str:
 
 
 def _banner(title: str) -> str:
-    line = "=" * 80
-    return f"\n{line}\n{title}\n{line}"
+    return f"\n{_RULE}\n{title}\n{_RULE}"
 
 
 def print_demo_token(settings: ServerSettings) -> None:
@@ -33,7 +35,7 @@ def print_demo_token(settings: ServerSettings) -> None:
     Also:
     - Never print 0.0.0.0 as a client address; use 127.0.0.1 for examples.
     """
-    if not getattr(settings, "print_demo_token", True):
+    if not settings.print_demo_token:
         return
 
     transport = (settings.transport or "").strip().lower()
@@ -43,21 +45,20 @@ def print_demo_token(settings: ServerSettings) -> None:
         return
 
     base = _base_url(settings.host, settings.port)
-    endpoint_path = getattr(settings, "endpoint_path", "/mcp")
-    endpoint = f"{base}{endpoint_path}"
+    endpoint = f"{base}{settings.mcp_path}"
     
     if settings.jwt_required:
 
         jwt = JwtHS256(
-        settings.jwt_secret,
-        audience=getattr(settings, "jwt_audience", None),
-        issuer=getattr(settings, "jwt_issuer", None),
+            settings.jwt_secret,
+            audience=settings.jwt_audience,
+            issuer=settings.jwt_issuer,
         )
         token = jwt.generate_demo_token()
 
         print("🔐 copy - paste to export JWT token (HS256):")
         print(f"export TOKEN=\"{token}\"")
-        print("-" * 80)
+        print(_DIVIDER)
     else:
         print("JWT: disabled (JWT_REQUIRED=false).")
        
@@ -66,19 +67,16 @@ def print_demo_token(settings: ServerSettings) -> None:
     # SSE: no JWT in this demo
     if transport == "sse":
         print(_banner("📡 MCP Server (SSE)"))
-        endpoint_path = getattr(settings, "sse_path", "/sse")
-        endpoint = f"{base}{endpoint_path}"
+        endpoint = f"{base}{settings.sse_path}"
         print(endpoint)
-        print("-" * 80)
+        print(_DIVIDER)
         return
 
     # Streamable HTTP: JWT demo
     if transport == "streamable-http":
         print(_banner("🌐 MCP Server (Streamable HTTP)"))
-        endpoint_path = getattr(settings, "mcp_path", "/mcp")
-        endpoint = f"{base}{endpoint_path}"
         print(endpoint)
-        print("-" * 80)
+        print(_DIVIDER)
         return
       
 
@@ -87,4 +85,4 @@ def print_demo_token(settings: ServerSettings) -> None:
     print(f"Unknown transport: {settings.transport}")
     print("Endpoint:")
     print(endpoint)
-    print("=" * 80 + "\n")
+    print(_RULE + "\n")
@@ -13,23 +13,26 @@ class McpRunner:
     def __init__(self, mcp: FastMCP):
         self.mcp = mcp
 
-    def _wrap_with_health_and_jwt(self, *, settings: ServerSettings, base_asgi) :
+    @staticmethod
+    def _wrap_with_health_and_jwt(*, settings: ServerSettings, base_asgi) :
+        allowlist = settings.jwt_allowlist_paths
+        # "*" allowlists every path: the middleware would only ever pass requests through
+        if not settings.jwt_required or "*" in allowlist:
+            return HealthMountApp(settings=settings, mounted=base_asgi)
+
+        jwt = JwtHS256(
+            settings.jwt_secret,
+            audience=settings.jwt_audience,
+            issuer=settings.jwt_issuer,
+        )
+        if "/health" in allowlist:
+            # public probe: answer it before the request ever reaches auth
+            app = JwtAuthMiddleware(base_asgi, jwt=jwt, required=True, allowlist_paths=allowlist)
+            return HealthMountApp(settings=settings, mounted=app)
+
+        # /health dropped from the allowlist means it should require a token too
         app = HealthMountApp(settings=settings, mounted=base_asgi)
-
-        if settings.jwt_required:
-            jwt = JwtHS256(
-                settings.jwt_secret,
-                audience=settings.jwt_audience,
-                issuer=settings.jwt_issuer,
-            )
-            app = JwtAuthMiddleware(
-                app,
-                jwt=jwt,
-                required=True,
-                allowlist_paths=settings.jwt_allowlist_paths,
-            )
-
-        return app
+        return JwtAuthMiddleware(app, jwt=jwt, required=True, allowlist_paths=allowlist)
 
     def run(self, settings: ServerSettings) -> None:
         print_demo_token(settings)
@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
+
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "y", "on"})
 
 
 def _env_bool(name: str, default: bool) -> bool:
     v = os.getenv(name)
     if v is None:
         return default
-    return v.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return v.strip().lower() in _TRUTHY
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerSettings:
     transport: str
     host: str
@@ -23,24 +26,37 @@ class ServerSettings:
     jwt_secret: str
     jwt_audience: str | None
     jwt_issuer: str | None
-    jwt_allowlist_paths: tuple[str, ...]
+    jwt_allowlist_paths: frozenset[str]
+
+    print_demo_token: bool = True
 
     @staticmethod
     def load(transport: str, host: str, port: int) -> ServerSettings:
-        allowlist = os.getenv("JWT_ALLOWLIST_PATHS", "/health")
-        allowlist_paths = tuple(p.strip() for p in allowlist.split(",") if p.strip())
-
-        jwt_required_default = transport in {"streamable-http"}
-
-        return ServerSettings(
-            transport=transport,
-            host=host,
-            port=port,
-            mcp_path=os.getenv("MCP_PATH", "/mcp"),
-            sse_path=os.getenv("SSE_PATH", "/sse"),
-            jwt_required=_env_bool("JWT_REQUIRED", jwt_required_default),
-            jwt_secret=os.getenv("JWT_SECRET", "dev-secret-change-me"),
-            jwt_audience=os.getenv("JWT_AUDIENCE") or None,
-            jwt_issuer=os.getenv("JWT_ISSUER") or None,
-            jwt_allowlist_paths=allowlist_paths,
-        )
+        return _load(transport, host, port)
+
+    @staticmethod
+    def reset_cache() -> None:
+        """Forget loaded settings so the next load() re-reads the environment (tests)."""
+        _load.cache_clear()
+
+
+# The environment is fixed once the process starts: read it once per (transport, host, port).
+@lru_cache(maxsize=8)
+def _load(transport: str, host: str, port: int) -> ServerSettings:
+    allowlist = os.getenv("JWT_ALLOWLIST_PATHS", "/health")
+    allowlist_paths = frozenset(filter(None, map(str.strip, allowlist.split(","))))
+
+    jwt_required_default = transport in {"streamable-http"}
+
+    return ServerSettings(
+        transport=transport,
+        host=host,
+        port=port,
+        mcp_path=os.getenv("MCP_PATH", "/mcp"),
+        sse_path=os.getenv("SSE_PATH", "/sse"),
+        jwt_required=_env_bool("JWT_REQUIRED", jwt_required_default),
+        jwt_secret=os.getenv("JWT_SECRET", "dev-secret-change-me"),
+        jwt_audience=os.getenv("JWT_AUDIENCE") or None,
+        jwt_issuer=os.getenv("JWT_ISSUER") or None,
+        jwt_allowlist_paths=allowlist_paths,
+    )
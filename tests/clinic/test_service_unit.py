@@ -1,4 +1,7 @@
+from bisect import bisect_left, bisect_right
+from contextlib import nullcontext
 from dataclasses import dataclass
+from operator import itemgetter
 
 import pytest
 
@@ -18,7 +21,7 @@ from clinic_mcp_server.clinic.domain.data_types import (
 from clinic_mcp_server.clinic.clinic_service import ClinicService
 
 
-@dataclass
+@dataclass(slots=True)
 class BillCall:
     pay_id: int
     amount: float
@@ -49,6 +52,8 @@ class FakeRepo(ClinicRepository):
             DoctorSearchResult(dr_id=2, dr_name="Dr Bob", specialty="family", rating=4.2, visit_fee=150.0, next_available_appointment=None),
             DoctorSearchResult(dr_id=3, dr_name="Dr Carol", specialty="dermatology", rating=4.9, visit_fee=200.0, next_available_appointment=None),
         ]
+        # kept in "ORDER BY rating desc" order so filtered searches come out sorted
+        self.doctors.sort(key=lambda d: d.rating, reverse=True)
 
         # slots
         self.slots: dict[int, AppointmentSlot] = {
@@ -57,6 +62,20 @@ class FakeRepo(ClinicRepository):
             3: AppointmentSlot(slot_id=3, dr_name="Dr Carol", specialty="dermatology", date="2030-01-03", start_time="11:00", end_time="11:30", visit_fee=200.0, rating=4.9),
         }
         self.slot_user: dict[int, int | None] = {1: None, 2: None, 3: None}
+        # reverse of slot_user, kept in step by add/remove_appointment
+        self._user_slots: dict[int, set[int]] = {}
+
+        # slots never change after construction (only slot_user does), so index them once:
+        # specialty -> [(date, start_time, slot_id)] in "ORDER BY date/start_time" order
+        self._slots_by_spec: dict[str, list[tuple[str, str, int]]] = {}
+        for sid, s in self.slots.items():
+            self._slots_by_spec.setdefault(s.specialty, []).append((s.date, s.start_time, sid))
+        for bucket in self._slots_by_spec.values():
+            bucket.sort()
+        self._slot_name_lc: dict[int, str] = {sid: s.dr_name.lower() for sid, s in self.slots.items()}
+
+    def transaction(self):
+        return nullcontext()
 
     # ---- Users ----
     def add_user(self, social_security_number:int, first_name:str, last_name:str, address:str, email:str, phone_number:str, membership_type:MembershipType) -> int:
@@ -108,35 +127,29 @@ class FakeRepo(ClinicRepository):
         return sorted({d.specialty for d in self.doctors})
 
     def search_doctors(self, specialty=None, min_rank=None, max_fee=None) -> list[DoctorSearchResult]:
-        out = self.doctors
-        if specialty:
-            out = [d for d in out if d.specialty == specialty]
-        if min_rank is not None:
-            out = [d for d in out if d.rating >= min_rank]
-        if max_fee is not None:
-            out = [d for d in out if d.visit_fee <= max_fee]
-        # mimic "ORDER BY rating desc"
-        out = sorted(out, key=lambda d: d.rating, reverse=True)
+        # one pass over the doctors with every filter applied, like a single WHERE clause
+        out = [
+            d for d in self.doctors
+            if (not specialty or d.specialty == specialty)
+            and (min_rank is None or d.rating >= min_rank)
+            and (max_fee is None or d.visit_fee <= max_fee)
+        ]
         return out
 
     def search_available_appointments(self, specialty, doctor_name=None, start_date=None, end_date=None) -> list[AppointmentSlot]:
-        def ok_date(s: AppointmentSlot) -> bool:
-            if start_date and s.date < start_date:
-                return False
-            if end_date and s.date > end_date:
-                return False
-            return True
-
-        out = [
-            s for sid, s in self.slots.items()
-            if s.specialty == specialty
-            and self.slot_user[sid] is None
-            and ok_date(s)
-            and (doctor_name is None or doctor_name.lower() in s.dr_name.lower())
-        ]
-        # mimic "ORDER BY date/start_time"
-        out.sort(key=lambda s: (s.date, s.start_time))
-        return out[:10]
+        bucket = self._slots_by_spec.get(specialty, [])
+        # the bucket is date-ordered: bisect the date range instead of checking every slot
+        lo = bisect_left(bucket, start_date, key=itemgetter(0)) if start_date else 0
+        hi = bisect_right(bucket, end_date, key=itemgetter(0)) if end_date else len(bucket)
+
+        needle = doctor_name.lower() if doctor_name is not None else None
+        out: list[AppointmentSlot] = []
+        for _, _, sid in bucket[lo:hi]:
+            if self.slot_user[sid] is None and (needle is None or needle in self._slot_name_lc[sid]):
+                out.append(self.slots[sid])
+                if len(out) == 10:
+                    break
+        return out
 
     def get_appointment_slot(self, slot_id: int) -> AppointmentSlot | None:
         return self.slots.get(slot_id)
@@ -147,15 +160,18 @@ class FakeRepo(ClinicRepository):
         if self.slot_user[slot_id] is not None:
             raise ConflictError("Slot not available")
         self.slot_user[slot_id] = user_id
+        self._user_slots.setdefault(user_id, set()).add(slot_id)
         return slot_id
 
     def remove_appointment(self, slot_id: int) -> None:
         # idempotent cancel
-        if slot_id in self.slot_user:
+        uid = self.slot_user.get(slot_id)
+        if uid is not None:
             self.slot_user[slot_id] = None
+            self._user_slots[uid].discard(slot_id)
 
     def get_user_appointments(self, user_id: int) -> list[AppointmentSlot]:
-        out = [self.slots[sid] for sid, uid in self.slot_user.items() if uid == user_id]
+        out = [self.slots[sid] for sid in self._user_slots.get(user_id, ())]
         out.sort(key=lambda s: (s.date, s.start_time))
         return out
 
@@ -233,6 +249,8 @@ def test_search_appointments_invalid_date(service_and_repo):
     svc, _ = service_and_repo
     with pytest.raises(ValidationError):
         svc.search_appointments("family", start_date="2030/01/01")
+    with pytest.raises(ValidationError):
+        svc.search_appointments("family", end_date="20x0-01-01")
 
 
 def test_get_slot_found_and_missing(service_and_repo):
@@ -8,6 +8,7 @@ from clinic_mcp_server.clinic.domain.data_types import (
     NotFoundError,
     ValidationError,
 )
+from clinic_mcp_server.clinic.sqlite.db import _SEARCH_SLOTS_SQL, SQLiteClinicDB
 from clinic_mcp_server.clinic.sqlite.repo import SQLiteClinicRepository
 from clinic_mcp_server.clinic.clinic_service import ClinicService
 
@@ -151,6 +152,30 @@ def test_doctor_search_filters(svc):
     assert all(d.visit_fee <= 120.0 for d in cheap)
 
 
+def test_doctor_search_next_available_matches_earliest_free_slot(svc, db_path):
+    conn, cur = _raw_conn(db_path)
+    try:
+        # book one doctor's earliest slot so the free/booked distinction matters
+        cur.execute("UPDATE slots SET user_id = (SELECT MIN(user_id) FROM users) WHERE slot_id = 1")
+        conn.commit()
+        cur.execute("""
+            SELECT d.dr_id, (
+                SELECT MIN(s.date || ' ' || s.start_time)
+                FROM slots s
+                WHERE s.dr_id = d.dr_id
+                  AND s.user_id IS NULL
+                  AND datetime(s.date || ' ' || s.start_time) >= datetime('now')
+            ) AS next_available
+            FROM doctors d
+        """)
+        expected = {r["dr_id"]: r["next_available"] for r in cur.fetchall()}
+    finally:
+        conn.close()
+
+    docs = svc.search_doctors()
+    assert {d.dr_id: d.next_available_appointment for d in docs} == expected
+
+
 def test_search_appointments_filters_and_slot_lookup(svc):
     # baseline
     slots = svc.search_appointments("family")
@@ -211,6 +236,26 @@ def test_booking_flow_bills_and_prevents_double_booking(svc, db_path):
         conn.close()
 
 
+def test_failed_billing_rolls_back_booking_and_registration(svc, repo, monkeypatch):
+    reg = _register_user(svc, 666777888, first="Rollback")
+    slot_id = svc.search_appointments("family")[0].slot_id
+
+    # unknown payment method: the bill violates its FK, so the booking must not stick
+    with pytest.raises(sqlite3.IntegrityError):
+        svc.schedule_appointment(reg.user_id, 999999, slot_id, 10.0)
+    assert all(a.slot_id != slot_id for a in svc.get_user_appointments(reg.user_id))
+
+    # billing fails after the user and payment rows were written
+    def failing_bill(*args, **kwargs):
+        raise RuntimeError("card declined")
+
+    monkeypatch.setattr(repo, "bill_user", failing_bill)
+    with pytest.raises(RuntimeError):
+        _register_user(svc, 666777999, first="Half")
+    with pytest.raises(NotFoundError):
+        svc.get_user_id(666777999)
+
+
 def test_cancel_then_rebook(svc):
     reg = _register_user(svc, 333444555, first="Carl")
 
@@ -252,3 +297,200 @@ def test_membership_validation_surfaces(svc):
             10.0,
             "platinum",
         )
+
+
+def test_repo_reuses_pooled_connection(repo):
+    with repo._db() as first:
+        pass
+    with repo._db() as second:
+        pass
+    assert first is second
+
+    repo.close()
+    with repo._db() as third:
+        assert third is not first
+    # pool is refilled transparently after close()
+    assert repo.get_available_dr_specialties()
+
+
+def test_concurrent_bookings_of_one_slot_have_one_winner(repo, svc):
+    from concurrent.futures import ThreadPoolExecutor
+
+    user_ids = [_register_user(svc, 555000000 + i, first=f"U{i}").user_id for i in range(8)]
+    slot_id = svc.search_appointments("family")[0].slot_id
+
+    def book(user_id):
+        try:
+            repo.add_appointment(user_id, slot_id)
+            return True
+        except ConflictError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(book, user_ids))
+    assert results.count(True) == 1
+    repo.close()
+
+
+def test_specialty_lookup_is_cached(repo, svc, monkeypatch):
+    specs = svc.list_specialties()
+
+    def no_query(self):
+        raise AssertionError("expected a cache hit")
+
+    monkeypatch.setattr(SQLiteClinicDB, "get_available_dr_specialties", no_query)
+    assert svc.list_specialties() == specs
+
+
+def test_reset_from_another_repository_is_seen(repo, svc, db_path):
+    alice = _register_user(svc, 111, first="Alice")
+    assert svc.get_user(alice.user_id).first_name == "Alice"
+    assert svc.list_specialties()
+
+    # e.g. the reset-db CLI: its own repository, and AUTOINCREMENT restarts after the DROP
+    other = SQLiteClinicRepository(str(db_path))
+    other.reset_database(seed=True)
+    bob = _register_user(ClinicService(other), 222, first="Bob")
+    assert bob.user_id == alice.user_id
+    assert svc.get_user(alice.user_id).first_name == "Bob"
+
+    other.reset_database(seed=False)
+    assert svc.list_specialties() == []
+    other.close()
+
+
+def test_reset_database_drops_data_and_reseeds(repo, svc, db_path):
+    reg = _register_user(svc, 777888999, first="Reset")
+    assert svc.get_user(reg.user_id).first_name == "Reset"
+    repo.reset_database(seed=True)
+
+    with pytest.raises(NotFoundError):
+        svc.get_user(reg.user_id)
+    with pytest.raises(NotFoundError):
+        svc.get_user_id(777888999)
+
+    conn, cur = _raw_conn(db_path)
+    try:
+        cur.execute("SELECT COUNT(*) AS c FROM doctors")
+        assert cur.fetchone()["c"] == 10
+        cur.execute("SELECT COUNT(*) AS c FROM slots")
+        assert cur.fetchone()["c"] > 0
+    finally:
+        conn.close()
+
+
+def test_search_indexes_exist_and_are_used(repo, db_path):
+    conn, cur = _raw_conn(db_path)
+    try:
+        cur.execute("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'")
+        names = {r["name"] for r in cur.fetchall()}
+        assert {
+            "idx_doctors_specialty_rating_fee",
+            "idx_slots_free_dr_date",
+            "idx_slots_user",
+            "idx_payment_methods_user",
+            "idx_users_ssn",
+        } <= names
+
+        cur.execute("EXPLAIN QUERY PLAN SELECT user_id FROM users WHERE social_security_number = ?", (1,))
+        assert any("idx_users_ssn" in r["detail"] for r in cur.fetchall())
+
+        cur.execute("EXPLAIN QUERY PLAN SELECT slot_id FROM slots WHERE user_id = ?", (1,))
+        assert any("idx_slots_user" in r["detail"] for r in cur.fetchall())
+
+        # the date range is part of the index search, not a post-filter
+        cur.execute(
+            "EXPLAIN QUERY PLAN " + _SEARCH_SLOTS_SQL[(False, True, True)],
+            ("family", "2030-01-01", "2030-12-31"),
+        )
+        # plan text varies across SQLite versions: look for the index and a date bound only
+        assert any(
+            "idx_slots_free_dr_date" in r["detail"] and "date>?" in r["detail"] for r in cur.fetchall()
+        )
+    finally:
+        conn.close()
+
+
+def test_hard_reset_keeps_file_when_healthy(repo, svc, db_path):
+    _register_user(svc, 888999000, first="Hard")
+    inode = db_path.stat().st_ino
+    repo.hard_reset_database()
+
+    assert db_path.stat().st_ino == inode
+    with pytest.raises(NotFoundError):
+        svc.get_user_id(888999000)
+
+
+def test_hard_reset_recreates_corrupt_file(tmp_path):
+    db_path = tmp_path / "corrupt.db"
+    db_path.write_bytes(b"this is not a sqlite database" * 200)
+
+    repo = SQLiteClinicRepository(str(db_path))
+    repo.hard_reset_database()
+    assert ClinicService(repo).list_specialties()
+
+
+def test_new_db_uses_tuned_page_size(repo, db_path):
+    conn, cur = _raw_conn(db_path)
+    try:
+        cur.execute("PRAGMA page_size")
+        assert cur.fetchone()[0] == 8192
+        cur.execute("PRAGMA journal_mode")
+        assert cur.fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
+def test_db_transaction_commits_together_or_rolls_back(repo, db_path):
+    with SQLiteClinicDB(str(db_path)) as db:
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.add_user(900000001, "T", "X", "Addr", "t@e.com", "+49")
+                raise RuntimeError("boom")
+        assert db.get_user_id(900000001) is None
+
+        with db.transaction():
+            user_id = db.add_user(900000002, "T", "Y", "Addr", "t@e.com", "+49")
+            pay_id = db.add_payment_method(user_id, 1111, "Visa", "12/30", "tok_t")
+        assert db.get_user_payment_methods(user_id)[0].pay_id == pay_id
+
+
+def test_seeded_slots_follow_opening_hours(repo, db_path):
+    from datetime import date, timedelta
+
+    from clinic_mcp_server.clinic.sqlite.populate import _add_slots
+
+    with SQLiteClinicDB(str(db_path)) as db:
+        db.cursor.execute("DELETE FROM slots")
+        _add_slots(db, days_range=14, from_date=date(2026, 1, 1))
+        db.cursor.execute("""
+            SELECT d.dr_id, d.slot_visiting_time, od.weekday, od.start_time, od.end_time
+            FROM doctors d JOIN doctor_opening_days od ON d.dr_id = od.dr_id
+        """)
+        expected = set()
+        for dr_id, step, weekday, start, end in db.cursor.fetchall():
+            for offset in range(14):
+                day = date(2026, 1, 1) + timedelta(days=offset)
+                if day.weekday() != weekday:
+                    continue
+                m, end_min = int(start[:2]) * 60 + int(start[3:]), int(end[:2]) * 60 + int(end[3:])
+                while m + step <= end_min:
+                    e = m + step
+                    expected.add((dr_id, day.isoformat(), f"{m // 60:02d}:{m % 60:02d}", f"{e // 60:02d}:{e % 60:02d}"))
+                    m = e
+
+        db.cursor.execute("SELECT dr_id, date, start_time, end_time FROM slots")
+        assert {tuple(r) for r in db.cursor.fetchall()} == expected
+
+
+def test_read_models_carry_declared_types(svc):
+    # read paths skip pydantic validation, so the column affinities must already match
+    reg = _register_user(svc, 321321321, first="Typed")
+    user = svc.get_user(reg.user_id)
+    assert user.model_validate(user.model_dump()) == user
+    for pm in svc.get_user_payment_methods(reg.user_id):
+        assert pm.model_validate(pm.model_dump()) == pm
+    for doc in svc.search_doctors():
+        assert type(doc.rating) is float and type(doc.visit_fee) is float
+    for slot in svc.search_appointments("family"):
+        assert type(slot.slot_id) is int and type(slot.visit_fee) is float
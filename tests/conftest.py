@@ -6,12 +6,13 @@ import os
 import socket
 import subprocess
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import httpx
 import pytest
+import pytest_asyncio
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
@@ -20,22 +21,27 @@ from mcp.client.streamable_http import streamable_http_client
 from clinic_mcp_server.mcp.auth.jwt_hs256 import JwtHS256
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Iterator
 
 
 # ---------- Helpers ----------
 
+# Poll quickly at first (the server is often up within a few ms of its port being bound),
+# then back off to the old fixed 100 ms interval.
+_PORT_POLL_DELAYS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1)
+
+
 def wait_for_port(host: str, port: int, timeout: float = 10.0) -> bool:
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while time.monotonic() < deadline:
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(1)
-                if sock.connect_ex((host, port)) == 0:
-                    return True
-        except Exception:
+            with socket.create_connection((host, port), timeout=1):
+                return True
+        except OSError:
             pass
-        time.sleep(0.1)
+        time.sleep(_PORT_POLL_DELAYS[min(attempt, len(_PORT_POLL_DELAYS) - 1)])
+        attempt += 1
     return False
 
 
@@ -63,6 +69,13 @@ def _auth_headers(token: str) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_http_client() -> AsyncGenerator[httpx.AsyncClient]:
+    """One connection pool for plain HTTP checks; tests using it run on the session loop."""
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        yield client
+
+
 # ---------- STDIO session ----------
 
 @pytest.fixture
@@ -94,15 +107,17 @@ def stdio_session(tmp_path: Path):
 
 
 # ---------- HTTP server fixtures ----------
+# Servers are started once per test session; sessions reset the DB through the
+# admin_reset_db tool instead of paying for a fresh subprocess (uv + imports) per test.
 
-@pytest.fixture
-def http_server(tmp_path: Path):
-    """Start Streamable HTTP MCP server and return base URL."""
-    host = "127.0.0.1"
-    port = 3001
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
 
-    env = _server_env(tmp_path)
 
+@contextmanager
+def _run_server(transport: str, host: str, port: int, env: dict[str, str]) -> Iterator[str]:
     proc = subprocess.Popen(
         [
             "uv",
@@ -112,7 +127,7 @@ def http_server(tmp_path: Path):
             "clinic_mcp_server",
             "run",
             "--transport",
-            "streamable-http",
+            transport,
             "--host",
             host,
             "--port",
@@ -124,8 +139,8 @@ def http_server(tmp_path: Path):
     try:
         if not wait_for_port(host, port, timeout=10.0):
             if proc.poll() is not None:
-                raise RuntimeError(f"HTTP server exited with code {proc.returncode}")
-            raise RuntimeError(f"HTTP server failed to start on port {port}")
+                raise RuntimeError(f"{transport} server exited with code {proc.returncode}")
+            raise RuntimeError(f"{transport} server failed to start on port {port}")
 
         yield f"http://{host}:{port}"
     finally:
@@ -137,6 +152,13 @@ def http_server(tmp_path: Path):
             proc.wait()
 
 
+@pytest.fixture(scope="session")
+def http_server(tmp_path_factory: pytest.TempPathFactory):
+    """Start Streamable HTTP MCP server and return base URL."""
+    host = "127.0.0.1"
+    env = _server_env(tmp_path_factory.mktemp("http_server"))
+    with _run_server("streamable-http", host, _free_port(host), env) as url:
+        yield url
 
 
 # ---------- HTTP sessions ----------
@@ -152,6 +174,7 @@ def http_session(http_server, demo_jwt_token):
             async with streamable_http_client(f"{http_server}/mcp", http_client=client) as (read, write, _):
                 async with ClientSession(read, write) as session:
                     await session.initialize()
+                    await session.call_tool("admin_reset_db", {})  # fresh data per test
                     yield session
 
     return _session()
@@ -160,33 +183,14 @@ def http_session(http_server, demo_jwt_token):
 
 
 # -------------- SSE sessions -------------------
-@pytest.fixture
-def sse_server(tmp_path: Path):
+@pytest.fixture(scope="session")
+def sse_server(tmp_path_factory: pytest.TempPathFactory):
     host = "127.0.0.1"
-    port = 3002
-
-    env = _server_env(tmp_path)
+    env = _server_env(tmp_path_factory.mktemp("sse_server"))
     # Important: SSE has NO JWT in this demo
     env["JWT_REQUIRED"] = "false"
-
-    proc = subprocess.Popen(
-        ["uv", "run", "python", "-m", "clinic_mcp_server", "run","--transport", "sse", "--host", host, "--port", str(port)],
-        env=env,
-    )
-
-    try:
-        if not wait_for_port(host, port, timeout=10.0):
-            if proc.poll() is not None:
-                raise RuntimeError(f"SSE server exited with code {proc.returncode}")
-            raise RuntimeError("SSE server failed to start")
-        yield f"http://{host}:{port}"
-    finally:
-        proc.terminate()
-        try:
-            proc.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            proc.wait()
+    with _run_server("sse", host, _free_port(host), env) as url:
+        yield url
 
 
 @pytest.fixture
@@ -196,6 +200,7 @@ def sse_session(sse_server):
         async with sse_client(f"{sse_server}/sse") as (read, write):
             async with ClientSession(read, write) as session:
                 await session.initialize()
+                await session.call_tool("admin_reset_db", {})  # fresh data per test
                 yield session
 
     return _session()
@@ -0,0 +1,28 @@
+"""In-process ASGI helpers shared by the middleware and health-endpoint tests."""
+
+from __future__ import annotations
+
+
+class DummyApp:
+    def __init__(self):
+        self.called = False
+        self.last_scope = None
+
+    async def __call__(self, scope, receive, send):
+        self.called = True
+        self.last_scope = scope
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def run_asgi(app, scope):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
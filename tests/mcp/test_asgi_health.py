@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from asgi_helpers import DummyApp, run_asgi
+
+from clinic_mcp_server.mcp.auth.middleware import JwtAuthMiddleware
+from clinic_mcp_server.mcp.runtime.asgi_health import HealthMountApp
+from clinic_mcp_server.mcp.runtime.runner import McpRunner
+from clinic_mcp_server.mcp.runtime.settings import ServerSettings
+
+
+def _settings(allowlist=frozenset({"/health"})) -> ServerSettings:
+    return ServerSettings(
+        transport="streamable-http",
+        host="127.0.0.1",
+        port=3001,
+        mcp_path="/mcp",
+        sse_path="/sse",
+        jwt_required=True,
+        jwt_secret="secret",
+        jwt_audience=None,
+        jwt_issuer=None,
+        jwt_allowlist_paths=allowlist,
+    )
+
+
+@pytest.mark.asyncio
+async def test_health_returns_settings_payload():
+    dummy = DummyApp()
+    app = HealthMountApp(settings=_settings(), mounted=dummy)
+
+    scope = {"type": "http", "method": "GET", "path": "/health", "headers": []}
+    sent = await run_asgi(app, scope)
+
+    assert dummy.called is False
+    assert sent[0]["status"] == 200
+    headers = dict(sent[0]["headers"])
+    body = sent[1]["body"]
+    assert headers[b"content-length"] == str(len(body)).encode("ascii")
+    payload = json.loads(body)
+    assert payload["status"] == "ok"
+    assert payload["port"] == 3001
+    assert payload["jwt_allowlist_paths"] == ["/health"]
+
+    # served from the prebuilt response on every call
+    assert await run_asgi(app, scope) == sent
+
+
+@pytest.mark.asyncio
+async def test_other_paths_are_delegated():
+    dummy = DummyApp()
+    app = HealthMountApp(settings=_settings(), mounted=dummy)
+
+    sent = await run_asgi(app, {"type": "http", "method": "POST", "path": "/mcp", "headers": []})
+
+    assert dummy.called is True
+    assert sent[1]["body"] == b"ok"
+
+
+def test_public_health_is_served_outside_jwt():
+    app = McpRunner._wrap_with_health_and_jwt(settings=_settings(), base_asgi=DummyApp())
+    assert isinstance(app, HealthMountApp)
+    assert isinstance(app._mounted, JwtAuthMiddleware)
+
+
+def test_health_stays_behind_jwt_when_not_allowlisted():
+    app = McpRunner._wrap_with_health_and_jwt(settings=_settings(allowlist=frozenset()), base_asgi=DummyApp())
+    assert isinstance(app, JwtAuthMiddleware)
+
+
+def test_wildcard_allowlist_skips_jwt():
+    app = McpRunner._wrap_with_health_and_jwt(settings=_settings(allowlist=frozenset({"*"})), base_asgi=DummyApp())
+    assert isinstance(app, HealthMountApp)
+    assert isinstance(app._mounted, DummyApp)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import httpx
 import pytest
 
 # @pytest.mark.asyncio
@@ -11,8 +10,7 @@ import pytest
 #                 async with ClientSession(read, write) as session:
 #                     await session.initialize()
 
-@pytest.mark.asyncio
-async def test_http_rejects_without_jwt(http_server):
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        r = await client.get(f"{http_server}/mcp")
-        assert r.status_code == 401
\ No newline at end of file
+@pytest.mark.asyncio(loop_scope="session")
+async def test_http_rejects_without_jwt(http_server, shared_http_client):
+    r = await shared_http_client.get(f"{http_server}/mcp")
+    assert r.status_code == 401
@@ -1,7 +1,11 @@
+import time
+
 import pytest
 
 from clinic_mcp_server.mcp.auth.jwt_hs256 import JwtHS256
 
+_B64URL_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
 
 def test_generate_and_verify_success():
     jwt = JwtHS256("secret")
@@ -44,3 +48,53 @@ def test_issuer_mismatch_fails():
     jwt_check = JwtHS256("secret", issuer="issuer-b")
     with pytest.raises(ValueError, match="issuer"):
         jwt_check.verify(token)
+
+
+def test_verify_tampered_signature_fails():
+    jwt = JwtHS256("secret")
+    header_b64, payload_b64, _ = jwt.generate_demo_token(valid_seconds=60).split(".")
+    other_sig = JwtHS256("other-secret").generate_demo_token(valid_seconds=60).split(".")[2]
+    with pytest.raises(ValueError, match="signature"):
+        jwt.verify(f"{header_b64}.{payload_b64}.{other_sig}")
+
+
+@pytest.mark.parametrize(
+    "respell",
+    [
+        lambda sig: sig[:20] + "    " + sig[20:],
+        lambda sig: sig[:20] + "!!!!" + sig[20:],
+        # 43 chars carry 258 bits for a 256-bit digest: flip one of the 2 unused low bits
+        lambda sig: sig[:-1] + _B64URL_ALPHABET[_B64URL_ALPHABET.index(sig[-1]) ^ 1],
+    ],
+)
+def test_verify_rejects_equivalent_signature_spellings(respell):
+    jwt = JwtHS256("secret")
+    header_b64, payload_b64, sig = jwt.generate_demo_token(valid_seconds=60).split(".")
+    with pytest.raises(ValueError, match="signature"):
+        jwt.verify(f"{header_b64}.{payload_b64}.{respell(sig)}")
+
+
+def test_verify_cache_does_not_outlive_exp(monkeypatch):
+    jwt = JwtHS256("secret")
+    token = jwt.generate_demo_token(valid_seconds=60)
+    claims = jwt.verify(token, leeway_seconds=0)
+    assert jwt.verify(token, leeway_seconds=0) == claims  # served from cache
+
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + 120)
+    with pytest.raises(ValueError, match="expired"):
+        jwt.verify(token, leeway_seconds=0)
+
+
+def test_verify_accepts_equivalent_header_and_rejects_other_alg():
+    jwt = JwtHS256("secret")
+    _, payload_b64, _ = jwt.generate_demo_token(valid_seconds=60).split(".")
+
+    def signed(header: bytes) -> str:
+        signing_input = f"{jwt._b64url_encode(header)}.{payload_b64}"
+        return f"{signing_input}.{jwt._sign(signing_input.encode('ascii'))}"
+
+    # same algorithm, different serialization: parsed instead of fast-matched
+    assert jwt.verify(signed(b'{"typ":"JWT","alg":"HS256"}'))["sub"] == "demo-user"
+    with pytest.raises(ValueError, match="HS256"):
+        jwt.verify(signed(b'{"alg":"none","typ":"JWT"}'))
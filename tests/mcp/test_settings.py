@@ -1,7 +1,17 @@
 
+import pytest
+
 from clinic_mcp_server.mcp.runtime.settings import ServerSettings
 
 
+@pytest.fixture(autouse=True)
+def _fresh_settings():
+    # load() is cached per process; each test sets up its own environment
+    ServerSettings.reset_cache()
+    yield
+    ServerSettings.reset_cache()
+
+
 def test_settings_defaults_stdio(monkeypatch):
     monkeypatch.delenv("JWT_REQUIRED", raising=False)
     s = ServerSettings.load(transport="stdio", host="127.0.0.1", port=8080)
@@ -25,6 +35,17 @@ def test_settings_env_overrides(monkeypatch):
     s = ServerSettings.load(transport="streamable-http", host="h", port=1)
     assert s.jwt_required is False
     assert s.jwt_secret == "abc"
-    assert s.jwt_allowlist_paths == ("/health", "/public")
+    assert s.jwt_allowlist_paths == frozenset({"/health", "/public"})
     assert s.jwt_audience == "clinic"
     assert s.jwt_issuer == "issuer1"
+
+
+def test_settings_load_is_cached(monkeypatch):
+    monkeypatch.setenv("JWT_SECRET", "first")
+    s = ServerSettings.load(transport="streamable-http", host="h", port=1)
+
+    monkeypatch.setenv("JWT_SECRET", "second")
+    assert ServerSettings.load(transport="streamable-http", host="h", port=1) is s
+
+    ServerSettings.reset_cache()
+    assert ServerSettings.load(transport="streamable-http", host="h", port=1).jwt_secret == "second"